@@ -0,0 +1,86 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import metabodecon as md
+
+
+def focus_indices(chemical_shifts, focus):
+    if chemical_shifts[0] > chemical_shifts[-1]:
+        focus = (focus[1], focus[0])
+    x0 = chemical_shifts[0]
+    dx = (chemical_shifts[-1] - x0) / (len(chemical_shifts) - 1)
+    lo = max(int(round((focus[0] - x0) / dx)), 0)
+    hi = min(int(round((focus[1] - x0) / dx)), len(chemical_shifts))
+    return lo, hi
+
+
+def plot_alignment(spectra, superpositions, centers, focus):
+    cache = []
+    for s, y_full, maxp in zip(spectra, superpositions, centers):
+        lo, hi = focus_indices(s.chemical_shifts, focus)
+        x = s.chemical_shifts[lo:hi]
+        y = y_full[lo:hi]
+        first, last = np.searchsorted(maxp, np.asarray(focus))
+        peaks = maxp[first:last]
+        maxima = np.interp(peaks, x, y)
+        cache.append((x, y, peaks, maxima))
+    offset_factor = np.mean([y.max() for _, y, _, _ in cache]) * 0.7
+    fig, ax = plt.subplots(figsize=(12, 8), dpi=150)
+    for i, (x, y, peaks, maxima) in enumerate(cache):
+        offset = i * offset_factor
+        ax.plot(x, y + offset, linewidth=0.5)
+        ax.scatter(peaks, maxima + offset, marker="x")
+    ax.invert_xaxis()
+    ax.set_xlabel("Chemical Shifts", fontsize=16)
+    ax.set_ylabel("Intensity", fontsize=16)
+    ax.tick_params(labelsize=14)
+    plt.show()
+    plt.close(fig)
+
+
+def plot_deconvolutions(spectra, superpositions, centers, focus):
+    cache = []
+    for s, y_full, maxp in zip(spectra, superpositions, centers):
+        lo, hi = focus_indices(s.chemical_shifts, focus)
+        x = s.chemical_shifts[lo:hi]
+        y = y_full[lo:hi]
+        first, last = np.searchsorted(maxp, np.asarray(focus))
+        peaks = maxp[first:last]
+        maxima = np.interp(peaks, x, y)
+        cache.append((x, s.intensities[lo:hi], y, peaks, maxima))
+    offset_factor = np.mean([y.max() for _, _, y, _, _ in cache]) * 0.7
+    fig, ax = plt.subplots(figsize=(12, 8), dpi=150)
+    for i, (x, intensities, y, peaks, maxima) in enumerate(cache):
+        offset = i * offset_factor
+        ax.plot(x, intensities + offset, linewidth=0.5)
+        ax.plot(x, y + offset, linewidth=0.5)
+        ax.scatter(peaks, maxima + offset, marker="x")
+    ax.invert_xaxis()
+    ax.set_xlabel("Chemical Shifts", fontsize=16)
+    ax.set_ylabel("Intensity", fontsize=16)
+    ax.tick_params(labelsize=14)
+    plt.show()
+    plt.close(fig)
+
+
+def main():
+    signal = (3.34, 3.56)
+    spectra = md.Spectrum.read_bruker_set(
+        "../../data/bruker/sim", 10, 10, signal, ascending=True
+    )
+
+    deconvoluter = md.Deconvoluter()
+    deconvolutions = deconvoluter.par_deconvolute_spectra(spectra)
+
+    superpositions = md.Lorentzian.par_superposition_batch(
+        spectra[0].chemical_shifts, [d.lorentzians for d in deconvolutions]
+    )
+    centers = [np.sort(d.maxp_arr) for d in deconvolutions]
+
+    edges = np.linspace(3.34, 3.56, 7)
+    for focus in zip(edges[:-1], edges[1:]):
+        plot_alignment(spectra, superpositions, centers, focus)
+        plot_deconvolutions(spectra, superpositions, centers, focus)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,19 +9,19 @@ def plot_deconvolution(spectrum, deconvolution, water_boundaries):
     y2 = deconvolution.par_superposition_vec(spectrum.chemical_shifts)
     s = spectrum.signal_boundaries
     w = water_boundaries
-    plt.figure(figsize=(12, 8), dpi=300)
-    plt.plot(x, y1, label="Original Spectrum")
-    plt.plot(x, y2, label="Deconvoluted Spectrum", linewidth=0.5)
-    plt.gca().invert_xaxis()
-    plt.axvline(x=s[0], color="black", label="Signal Boundaries")
-    plt.axvline(x=s[1], color="black")
-    plt.axvspan(w[0], w[1], color="cyan", alpha=0.3, label="Water Region")
-    plt.xlabel("Chemical Shifts", fontsize=16)
-    plt.ylabel("Intensity", fontsize=16)
-    plt.xticks(fontsize=14)
-    plt.yticks(fontsize=14)
-    plt.legend()
+    fig, ax = plt.subplots(figsize=(12, 8), dpi=150)
+    ax.plot(x, y1, label="Original Spectrum")
+    ax.plot(x, y2, label="Deconvoluted Spectrum", linewidth=0.5)
+    ax.invert_xaxis()
+    ax.axvline(x=s[0], color="black", label="Signal Boundaries")
+    ax.axvline(x=s[1], color="black")
+    ax.axvspan(w[0], w[1], color="cyan", alpha=0.3, label="Water Region")
+    ax.set_xlabel("Chemical Shifts", fontsize=16)
+    ax.set_ylabel("Intensity", fontsize=16)
+    ax.tick_params(labelsize=14)
+    ax.legend()
     plt.show()
+    plt.close(fig)
 
 
 def main():
@@ -40,10 +40,16 @@ def main():
     t2 = time.time()
     print(f"Parallel {(t2 - t1) * 1000:.3f}ms")
 
+    t1 = time.time()
     deconvolution.write_json("blood_deconvolution.json")
     deconvolution_json = md.Deconvolution.read_json("blood_deconvolution.json")
+    t2 = time.time()
+    print(f"JSON round-trip {(t2 - t1) * 1000:.3f}ms")
+    t1 = time.time()
     deconvolution.write_bin("blood_deconvolution.bin")
     deconvolution_bin = md.Deconvolution.read_bin("blood_deconvolution.bin")
+    t2 = time.time()
+    print(f"Binary round-trip {(t2 - t1) * 1000:.3f}ms")
 
     plot_deconvolution(blood, deconvolution, water_boundaries)
     plot_deconvolution(blood, deconvolution_json, water_boundaries)
@@ -1,7 +1,28 @@
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 import metabodecon as md
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def superposition_numba(x, sf, hw, maxp):
+        out = np.zeros_like(x)
+        for i in prange(x.size):
+            xi = x[i]
+            total = 0.0
+            for d in range(sf.size):
+                dx = xi - maxp[d]
+                total += sf[d] * hw[d] / (dx * dx + hw[d] * hw[d])
+            out[i] = total
+        return out
+
 
 def main():
     lorentzian = md.Lorentzian(
@@ -30,11 +51,23 @@ def main():
     maxp = [4.5, 5.0, 5.5]
     lorentzians = [md.Lorentzian(sf=sf, hw=hw, maxp=maxp) for sf, hw, maxp in zip(sf, hw, maxp)]
     x = np.linspace(0, 10, 100000)
+    t1 = time.time()
     y = md.Lorentzian.par_superposition_vec(x, lorentzians)
+    t2 = time.time()
+    print(f"Rust {(t2 - t1) * 1000:.3f}ms")
     plt.figure(figsize=(8, 6), dpi=300)
     plt.plot(x, y)
     plt.show()
 
+    if njit is not None:
+        sf, hw, maxp = md.Lorentzian.batch_params(lorentzians)
+        superposition_numba(x, sf, hw, maxp)
+        t1 = time.time()
+        y_numba = superposition_numba(x, sf, hw, maxp)
+        t2 = time.time()
+        print(f"Numba {(t2 - t1) * 1000:.3f}ms")
+        print(f"Max deviation {np.abs(y_numba - y).max():.3e}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import metabodecon as md
+
+
+def main():
+    signal = (-2.2, 11.8)
+    blood = md.Spectrum.read_bruker("../../data/bruker/blood/blood_01", 10, 10, signal)
+    water_boundaries = (4.7, 4.9)
+
+    smoothing_iterations = [1, 2, 3]
+    smoothing_window_sizes = [3, 5, 7, 9]
+    noise_score_thresholds = [5.0, 6.0, 7.0, 8.0]
+    fitter_iterations = [5, 10, 15, 20]
+    grid = np.stack(
+        np.meshgrid(
+            smoothing_iterations,
+            smoothing_window_sizes,
+            noise_score_thresholds,
+            fitter_iterations,
+            indexing="ij",
+        ),
+        axis=-1,
+    ).reshape(-1, 4)
+
+    deconvoluter = md.Deconvoluter()
+    deconvoluter.add_ignore_region(water_boundaries)
+    mse = deconvoluter.par_grid_search(blood, grid)
+
+    param_table = pd.DataFrame(
+        grid,
+        columns=[
+            "SmoothingIterations",
+            "SmoothingWindowSize",
+            "NoiseScoreThreshold",
+            "FitterIterations",
+        ],
+    )
+    param_table["MSE"] = mse
+
+    long = param_table.melt(id_vars="MSE", var_name="param", value_name="value")
+    min_mse_per_parameter = long.groupby(["param", "value"])["MSE"].min()
+
+    fig, axs = plt.subplots(2, 2, figsize=(12, 10), dpi=150)
+    for ax, column in zip(axs.flat, param_table.columns[:-1]):
+        min_mse = min_mse_per_parameter.loc[column]
+        ax.plot(min_mse.index, min_mse.values, marker="o")
+        ax.set_xlabel(column)
+        ax.set_ylabel("Minimum MSE")
+    fig.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
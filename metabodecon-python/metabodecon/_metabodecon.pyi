@@ -3,6 +3,14 @@ import numpy as np
 __version__: str
 
 
+class BrukerSetIterator:
+    def __iter__(self) -> "BrukerSetIterator":
+        ...
+
+    def __next__(self) -> "Spectrum":
+        ...
+
+
 class Deconvoluter:
     def __init__(self) -> None:
         ...
@@ -46,12 +54,18 @@ class Deconvoluter:
     def par_deconvolute_spectra(self, spectra: list["Spectrum"]) -> list["Deconvolution"]:
         ...
 
+    def par_grid_search(self, spectrum: "Spectrum", parameters: np.ndarray) -> np.ndarray:
+        ...
+
     def optimize_settings(self, reference: "Spectrum") -> float:
         ...
 
 
 class Deconvolution:
     lorentzians: list["Lorentzian"]
+    sf_arr: np.ndarray
+    hw_arr: np.ndarray
+    maxp_arr: np.ndarray
     mse: float
 
     def superposition(self, x: float) -> float:
@@ -99,6 +113,11 @@ class Lorentzian:
     def integral(self) -> float:
         ...
 
+    @staticmethod
+    def batch_params(lorentzians: list["Lorentzian"]) -> tuple[
+        np.ndarray, np.ndarray, np.ndarray]:
+        ...
+
     @staticmethod
     def superposition(x: float, lorentzians: list["Lorentzian"]) -> float:
         ...
@@ -111,6 +130,11 @@ class Lorentzian:
     def par_superposition_vec(x: np.ndarray, lorentzians: list["Lorentzian"]) -> np.ndarray:
         ...
 
+    @staticmethod
+    def par_superposition_batch(x: np.ndarray, lorentzians: list[
+        list["Lorentzian"]]) -> np.ndarray:
+        ...
+
 
 class Spectrum:
     chemical_shifts: np.ndarray
@@ -131,8 +155,14 @@ class Spectrum:
 
     @staticmethod
     def read_bruker_set(path: str, experiment: int, processing: int,
-                        signal_boundaries: tuple[float, float]) -> list[
-        "Spectrum"]:
+                        signal_boundaries: tuple[float, float],
+                        ascending: bool = False) -> list["Spectrum"]:
+        ...
+
+    @staticmethod
+    def read_bruker_set_iter(path: str, experiment: int, processing: int,
+                             signal_boundaries: tuple[float, float],
+                             ascending: bool = False) -> "BrukerSetIterator":
         ...
 
     @staticmethod
@@ -8,4 +8,16 @@ mod lorentzian;
 pub(crate) use lorentzian::Lorentzian;
 
 mod spectrum;
-pub(crate) use spectrum::Spectrum;
+pub(crate) use spectrum::{BrukerSetIterator, Spectrum};
+
+use numpy::PyReadonlyArray1;
+use std::borrow::Cow;
+
+/// Internal helper function that borrows a NumPy array as a float64 slice
+/// without copying if it is contiguous, and converts it once otherwise.
+pub(crate) fn as_contiguous<'a>(array: &'a PyReadonlyArray1<'_, f64>) -> Cow<'a, [f64]> {
+    match array.as_slice() {
+        Ok(slice) => Cow::Borrowed(slice),
+        Err(_) => Cow::Owned(array.as_array().iter().copied().collect()),
+    }
+}
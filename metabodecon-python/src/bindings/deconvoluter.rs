@@ -1,11 +1,17 @@
 use crate::bindings::{Deconvolution, Spectrum};
 use crate::error::{MetabodeconError, ThreadPoolError};
 use metabodecon::deconvolution;
+use numpy::{PyArray1, PyReadonlyArray2};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use rayon::prelude::*;
 use rayon::{ThreadPool, ThreadPoolBuilder};
 use std::sync::Arc;
 
+/// Grid rows sharing one smoother configuration, as
+/// (iterations, window size, [(row index, threshold, fitter iterations)]).
+type SmootherGroup = (f64, f64, Vec<(usize, f64, f64)>);
+
 #[pyclass]
 #[derive(Clone, Debug, Default)]
 pub(crate) struct Deconvoluter {
@@ -164,6 +170,82 @@ impl Deconvoluter {
         }
     }
 
+    pub(crate) fn par_grid_search<'py>(
+        &self,
+        py: Python<'py>,
+        spectrum: &Spectrum,
+        parameters: PyReadonlyArray2<'_, f64>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let parameters = parameters.as_array();
+        if parameters.ncols() != 4 {
+            return Err(PyValueError::new_err(
+                "parameter grid must have 4 columns: smoothing iterations, \
+                 smoothing window size, noise score threshold, fitter iterations",
+            ));
+        }
+        let mut groups: Vec<SmootherGroup> = Vec::new();
+        for (index, row) in parameters.outer_iter().enumerate() {
+            match groups.last_mut() {
+                Some((iterations, window_size, members))
+                    if *iterations == row[0] && *window_size == row[1] =>
+                {
+                    members.push((index, row[2], row[3]));
+                }
+                _ => groups.push((row[0], row[1], vec![(index, row[2], row[3])])),
+            }
+        }
+        let compute = || {
+            groups
+                .par_iter()
+                .map(|(iterations, window_size, members)| {
+                    let mut deconvoluter = self.inner.clone();
+                    deconvoluter.set_smoothing_settings(
+                        deconvolution::SmoothingSettings::MovingAverage {
+                            iterations: *iterations as usize,
+                            window_size: *window_size as usize,
+                        },
+                    )?;
+                    members
+                        .iter()
+                        .map(|(index, threshold, fitter_iterations)| {
+                            deconvoluter.set_selection_settings(
+                                deconvolution::SelectionSettings::NoiseScoreFilter {
+                                    scoring_method: deconvolution::ScoringMethod::MinimumSum,
+                                    threshold: *threshold,
+                                },
+                            )?;
+                            deconvoluter.set_fitting_settings(
+                                deconvolution::FittingSettings::Analytical {
+                                    iterations: *fitter_iterations as usize,
+                                },
+                            )?;
+
+                            deconvoluter
+                                .par_deconvolute_spectrum(spectrum.as_ref())
+                                .map(|deconvolution| (*index, deconvolution.mse()))
+                        })
+                        .collect::<metabodecon::Result<Vec<(usize, f64)>>>()
+                })
+                .collect::<metabodecon::Result<Vec<Vec<(usize, f64)>>>>()
+        };
+        let results = match &self.threads {
+            Some(threads) => threads.install(compute),
+            None => compute(),
+        };
+
+        match results {
+            Ok(results) => {
+                let mut mse = vec![0.0; parameters.nrows()];
+                for (index, value) in results.into_iter().flatten() {
+                    mse[index] = value;
+                }
+
+                Ok(PyArray1::from_vec(py, mse))
+            }
+            Err(error) => Err(MetabodeconError::from(error).into()),
+        }
+    }
+
     pub(crate) fn optimize_settings(&mut self, reference: &Spectrum) -> PyResult<f64> {
         match self.inner.optimize_settings(reference.as_ref()) {
             Ok(mse) => Ok(mse),
@@ -1,4 +1,4 @@
-use crate::bindings::Lorentzian;
+use crate::bindings::{Lorentzian, as_contiguous};
 use crate::error::SerializationError;
 use metabodecon::deconvolution;
 use numpy::{PyArray1, PyReadonlyArray1};
@@ -37,6 +37,39 @@ impl Deconvolution {
         )
     }
 
+    #[getter]
+    pub(crate) fn sf_arr<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_iter(
+            py,
+            self.inner
+                .lorentzians()
+                .iter()
+                .map(|lorentzian| lorentzian.sf()),
+        )
+    }
+
+    #[getter]
+    pub(crate) fn hw_arr<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_iter(
+            py,
+            self.inner
+                .lorentzians()
+                .iter()
+                .map(|lorentzian| lorentzian.hw()),
+        )
+    }
+
+    #[getter]
+    pub(crate) fn maxp_arr<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_iter(
+            py,
+            self.inner
+                .lorentzians()
+                .iter()
+                .map(|lorentzian| lorentzian.maxp()),
+        )
+    }
+
     #[getter]
     pub(crate) fn mse(&self) -> f64 {
         self.inner.mse()
@@ -54,7 +87,7 @@ impl Deconvolution {
         PyArray1::from_slice(
             py,
             &deconvolution::Lorentzian::superposition_vec(
-                chemical_shifts.as_slice().unwrap(),
+                &as_contiguous(&chemical_shifts),
                 self.inner.lorentzians(),
             ),
         )
@@ -68,7 +101,7 @@ impl Deconvolution {
         PyArray1::from_slice(
             py,
             &deconvolution::Lorentzian::par_superposition_vec(
-                chemical_shifts.as_slice().unwrap(),
+                &as_contiguous(&chemical_shifts),
                 self.inner.lorentzians(),
             ),
         )
@@ -1,6 +1,16 @@
+use crate::bindings::as_contiguous;
 use metabodecon::deconvolution;
-use numpy::{PyArray1, PyReadonlyArray1};
+use numpy::{PyArray1, PyArray2, PyReadonlyArray1};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use rayon::prelude::*;
+
+/// Parameters of a batch of Lorentzians as separate arrays.
+type ParamArrays<'py> = (
+    Bound<'py, PyArray1<f64>>,
+    Bound<'py, PyArray1<f64>>,
+    Bound<'py, PyArray1<f64>>,
+);
 
 #[pyclass]
 #[derive(Copy, Clone, Debug, Default)]
@@ -75,13 +85,25 @@ impl Lorentzian {
         py: Python<'py>,
         x: PyReadonlyArray1<'_, f64>,
     ) -> Bound<'py, PyArray1<f64>> {
-        PyArray1::from_slice(py, &self.inner.evaluate_vec(x.as_slice().unwrap()))
+        PyArray1::from_slice(py, &self.inner.evaluate_vec(&as_contiguous(&x)))
     }
 
     pub(crate) fn integral(&self) -> f64 {
         self.inner.integral()
     }
 
+    #[staticmethod]
+    pub(crate) fn batch_params<'py>(
+        py: Python<'py>,
+        lorentzians: Vec<Lorentzian>,
+    ) -> ParamArrays<'py> {
+        let sf = PyArray1::from_iter(py, lorentzians.iter().map(|l| l.inner.sf()));
+        let hw = PyArray1::from_iter(py, lorentzians.iter().map(|l| l.inner.hw()));
+        let maxp = PyArray1::from_iter(py, lorentzians.iter().map(|l| l.inner.maxp()));
+
+        (sf, hw, maxp)
+    }
+
     #[staticmethod]
     pub(crate) fn superposition(x: f64, lorentzians: Vec<Lorentzian>) -> f64 {
         deconvolution::Lorentzian::superposition(x, &lorentzians)
@@ -95,7 +117,7 @@ impl Lorentzian {
     ) -> Bound<'py, PyArray1<f64>> {
         PyArray1::from_slice(
             py,
-            &deconvolution::Lorentzian::superposition_vec(x.as_slice().unwrap(), &lorentzians),
+            &deconvolution::Lorentzian::superposition_vec(&as_contiguous(&x), &lorentzians),
         )
     }
 
@@ -107,7 +129,22 @@ impl Lorentzian {
     ) -> Bound<'py, PyArray1<f64>> {
         PyArray1::from_slice(
             py,
-            &deconvolution::Lorentzian::par_superposition_vec(x.as_slice().unwrap(), &lorentzians),
+            &deconvolution::Lorentzian::par_superposition_vec(&as_contiguous(&x), &lorentzians),
         )
     }
+
+    #[staticmethod]
+    pub(crate) fn par_superposition_batch<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArray1<'_, f64>,
+        lorentzians: Vec<Vec<Lorentzian>>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let x = as_contiguous(&x);
+        let rows = lorentzians
+            .par_iter()
+            .map(|lorentzians| deconvolution::Lorentzian::superposition_vec(&x, lorentzians))
+            .collect::<Vec<_>>();
+
+        PyArray2::from_vec2(py, &rows).map_err(|error| PyValueError::new_err(error.to_string()))
+    }
 }
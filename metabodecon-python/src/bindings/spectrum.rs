@@ -1,9 +1,12 @@
+use crate::bindings::as_contiguous;
 use crate::error::{MetabodeconError, SerializationError};
 use metabodecon::spectrum;
-use numpy::PyArray1;
+use numpy::{PyArray1, PyReadonlyArray1};
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
+use std::sync::Mutex;
+use std::sync::mpsc::{Receiver, sync_channel};
 
 #[pyclass]
 #[derive(Clone, Debug)]
@@ -27,10 +30,12 @@ impl From<spectrum::Spectrum> for Spectrum {
 impl Spectrum {
     #[new]
     pub(crate) fn new(
-        chemical_shifts: Vec<f64>,
-        intensities: Vec<f64>,
+        chemical_shifts: &Bound<'_, PyAny>,
+        intensities: &Bound<'_, PyAny>,
         signal_boundaries: (f64, f64),
     ) -> PyResult<Self> {
+        let chemical_shifts = extract_f64s(chemical_shifts)?;
+        let intensities = extract_f64s(intensities)?;
         match spectrum::Spectrum::new(chemical_shifts, intensities, signal_boundaries) {
             Ok(spectrum) => Ok(spectrum.into()),
             Err(error) => Err(MetabodeconError::from(error).into()),
@@ -51,18 +56,84 @@ impl Spectrum {
     }
 
     #[staticmethod]
+    #[pyo3(signature = (path, experiment, processing, signal_boundaries, ascending = false))]
     pub(crate) fn read_bruker_set(
         path: &str,
         experiment: u32,
         processing: u32,
         signal_boundaries: (f64, f64),
+        ascending: bool,
     ) -> PyResult<Vec<Self>> {
-        match spectrum::Bruker::read_spectra(path, experiment, processing, signal_boundaries) {
-            Ok(spectra) => Ok(spectra
+        let spectra = match spectrum::Bruker::par_read_spectra(
+            path,
+            experiment,
+            processing,
+            signal_boundaries,
+        ) {
+            Ok(spectra) => spectra,
+            Err(error) => return Err(MetabodeconError::from(error).into()),
+        };
+        let spectra = match ascending {
+            true => spectra
                 .into_iter()
-                .map(|spectrum| spectrum.into())
-                .collect()),
-            Err(error) => Err(MetabodeconError::from(error).into()),
+                .map(into_ascending)
+                .collect::<metabodecon::Result<Vec<_>>>()
+                .map_err(|error| PyErr::from(MetabodeconError::from(error)))?,
+            false => spectra,
+        };
+
+        Ok(spectra
+            .into_iter()
+            .map(|spectrum| spectrum.into())
+            .collect())
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (path, experiment, processing, signal_boundaries, ascending = false))]
+    pub(crate) fn read_bruker_set_iter(
+        path: String,
+        experiment: u32,
+        processing: u32,
+        signal_boundaries: (f64, f64),
+        ascending: bool,
+    ) -> BrukerSetIterator {
+        let (sender, receiver) = sync_channel(4);
+        std::thread::spawn(move || {
+            let entries = match std::fs::read_dir(&path) {
+                Ok(entries) => entries,
+                Err(error) => {
+                    let _ = sender.send(Err(error.into()));
+                    return;
+                }
+            };
+            let paths = entries.filter_map(|entry| {
+                entry.ok().and_then(|entry| {
+                    if entry.path().is_dir() {
+                        Some(entry.path())
+                    } else {
+                        None
+                    }
+                })
+            });
+            for entry in paths {
+                let result = spectrum::Bruker::read_spectrum(
+                    entry,
+                    experiment,
+                    processing,
+                    signal_boundaries,
+                )
+                .and_then(|spectrum| match ascending {
+                    true => into_ascending(spectrum),
+                    false => Ok(spectrum),
+                });
+                if sender.send(result).is_err() {
+                    break;
+                }
+            }
+        });
+
+        BrukerSetIterator {
+            receiver: Mutex::new(receiver),
         }
     }
 
@@ -231,3 +302,64 @@ impl Spectrum {
         }
     }
 }
+
+/// Iterator over the spectra of a Bruker TopSpin dataset directory that are
+/// read in a background thread, so consumers can process a spectrum while the
+/// next ones are still being loaded.
+#[pyclass]
+pub(crate) struct BrukerSetIterator {
+    receiver: Mutex<Receiver<metabodecon::Result<spectrum::Spectrum>>>,
+}
+
+#[pymethods]
+impl BrukerSetIterator {
+    pub(crate) fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    pub(crate) fn __next__(&self, py: Python<'_>) -> PyResult<Option<Spectrum>> {
+        let received = py.allow_threads(|| self.receiver.lock().unwrap().recv());
+
+        match received {
+            Ok(Ok(spectrum)) => Ok(Some(spectrum.into())),
+            Ok(Err(error)) => Err(MetabodeconError::from(error).into()),
+            Err(_) => Ok(None),
+        }
+    }
+}
+
+/// Internal helper function to extract a float64 vector from either a NumPy
+/// float64 array without copying or, as a fallback, any sequence of numbers
+/// with a single conversion.
+fn extract_f64s(values: &Bound<'_, PyAny>) -> PyResult<Vec<f64>> {
+    match values.extract::<PyReadonlyArray1<'_, f64>>() {
+        Ok(array) => Ok(as_contiguous(&array).into_owned()),
+        Err(_) => values.extract::<Vec<f64>>(),
+    }
+}
+
+/// Internal helper function to reorder a spectrum so that its chemical shifts
+/// are in increasing order, preserving the metadata.
+fn into_ascending(spectrum: spectrum::Spectrum) -> metabodecon::Result<spectrum::Spectrum> {
+    if spectrum.monotonicity() == spectrum::meta::Monotonicity::Increasing {
+        return Ok(spectrum);
+    }
+    let mut chemical_shifts = spectrum.chemical_shifts().to_vec();
+    let mut intensities = spectrum.intensities().to_vec();
+    chemical_shifts.reverse();
+    intensities.reverse();
+    let reference = spectrum.reference_compound();
+    let reference = spectrum::meta::ReferenceCompound::new(
+        reference.chemical_shift(),
+        spectrum.len() - 1 - reference.index(),
+        reference.name().map(|name| name.to_string()),
+        reference.method(),
+    );
+    let mut ascending =
+        spectrum::Spectrum::new(chemical_shifts, intensities, spectrum.signal_boundaries())?;
+    ascending.set_nucleus(spectrum.nucleus());
+    ascending.set_frequency(spectrum.frequency());
+    ascending.set_reference_compound(reference);
+
+    Ok(ascending)
+}
@@ -3,12 +3,13 @@ use pyo3::prelude::*;
 pub(crate) mod error;
 
 mod bindings;
-pub(crate) use bindings::{Deconvoluter, Deconvolution, Lorentzian, Spectrum};
+pub(crate) use bindings::{BrukerSetIterator, Deconvoluter, Deconvolution, Lorentzian, Spectrum};
 
 #[pymodule]
 fn _metabodecon(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
 
+    m.add_class::<BrukerSetIterator>()?;
     m.add_class::<Deconvoluter>()?;
     m.add_class::<Deconvolution>()?;
     m.add_class::<Lorentzian>()?;
@@ -9,6 +9,9 @@ use std::io::Read;
 use std::path::Path;
 use std::sync::LazyLock;
 
+#[cfg(feature = "parallel")]
+use rayon::prelude::*;
+
 /// Interface for reading 1D NMR spectra in the Bruker TopSpin format.
 ///
 /// # Format
@@ -375,6 +378,70 @@ impl Bruker {
         Ok(spectra)
     }
 
+    /// Reads all spectra from the Bruker TopSpin format directories under the
+    /// given path in parallel.
+    ///
+    /// The directory layout and the validity checks are the same as for
+    /// [`read_spectra`], but the datasets are read and parsed concurrently
+    /// using Rayon, which overlaps the file I/O of one dataset with the
+    /// decoding of others.
+    ///
+    /// # Errors
+    ///
+    /// The same errors as for [`read_spectra`] are possible.
+    ///
+    /// [`read_spectra`]: Self::read_spectra
+    ///
+    /// # Example
+    ///
+    /// ```
+    /// use metabodecon::spectrum::Bruker;
+    ///
+    /// # fn main() -> metabodecon::Result<()> {
+    /// let path = "path/to/root";
+    /// # let path = "../data/bruker/blood";
+    ///
+    /// // Read all spectra from Bruker TopSpin format directories within the root.
+    /// let spectra = Bruker::par_read_spectra(
+    ///     path,
+    ///     // Experiment number
+    ///     10,
+    ///     // Processing number
+    ///     10,
+    ///     // Signal boundaries
+    ///     (-2.2, 11.8),
+    /// )?;
+    /// # Ok(())
+    /// # }
+    /// ```
+    #[cfg(feature = "parallel")]
+    pub fn par_read_spectra<P: AsRef<Path>>(
+        path: P,
+        experiment: u32,
+        processing: u32,
+        signal_boundaries: (f64, f64),
+    ) -> Result<Vec<Spectrum>> {
+        let paths = path
+            .as_ref()
+            .read_dir()?
+            .filter_map(|entry| {
+                entry.ok().and_then(|entry| {
+                    if entry.path().is_dir() {
+                        Some(entry.path())
+                    } else {
+                        None
+                    }
+                })
+            })
+            .collect::<Vec<_>>();
+        let spectra = paths
+            .par_iter()
+            .map(|entry| Self::read_spectrum(entry, experiment, processing, signal_boundaries))
+            .collect::<Result<Vec<Spectrum>>>()?;
+
+        Ok(spectra)
+    }
+
     /// Internal helper function to read the acquisition parameters from the
     /// `acqus` file and return them.
     ///
@@ -522,6 +589,23 @@ mod tests {
         });
     }
 
+    #[test]
+    #[cfg(feature = "parallel")]
+    fn par_read_spectra() {
+        let sim_path = "../data/bruker/sim";
+        let blood_path = "../data/bruker/blood";
+        let sim = Bruker::par_read_spectra(sim_path, 10, 10, (3.34, 3.56)).unwrap();
+        let blood = Bruker::par_read_spectra(blood_path, 10, 10, (-2.2, 11.8)).unwrap();
+        assert_eq!(sim.len(), 16);
+        assert_eq!(blood.len(), 16);
+        sim.iter().for_each(|spectrum| {
+            check_sim_spectrum!(spectrum);
+        });
+        blood.iter().for_each(|spectrum| {
+            check_blood_spectrum!(spectrum);
+        });
+    }
+
     #[test]
     fn read_acquisition_parameters() {
         let path = "../data/bruker/blood/blood_01/10/acqus";